@@ -77,8 +77,8 @@ def display_npv_results(inputs):
 
     for phase in phases:
         phase_value = calculate_phase_value(inputs, phase)
-        time_to_market = inputs["timeToMarket"][phase]
-        discount_rate = inputs["discountRate"]
+        time_to_market = inputs.timeToMarket[phase]
+        discount_rate = inputs.discountRate
         display_name = get_phase_display_name(phase)
 
         results_data.append(
@@ -104,13 +104,13 @@ def display_npv_results(inputs):
 
             if st.session_state.show_formulas:
                 phase = phases[i]
-                base_value = inputs["launchValue"] * get_order_multiplier(
-                    inputs, inputs["orderOfEntry"]
+                base_value = inputs.launchValue * get_order_multiplier(
+                    inputs, inputs.orderOfEntry
                 )
                 probability = get_cumulative_probability(inputs, phase)
-                discount_factor = (1 + (inputs["discountRate"] / 100)) ** inputs[
-                    "timeToMarket"
-                ][phase]
+                discount_factor = (
+                    1 + (inputs.discountRate / 100)
+                ) ** inputs.timeToMarket[phase]
 
                 st.write("---")
                 st.write("**Details:**")
@@ -118,10 +118,10 @@ def display_npv_results(inputs):
                 st.write(f"Prob: {(probability * 100):.1f}%")
                 st.write(f"Time: {(1/discount_factor):.3f}")
 
-                if inputs["includeRDCosts"]:
+                if inputs.includeRDCosts:
                     cumulative_costs = 0
                     for j in range(i + 1):
-                        cumulative_costs += inputs["costs"][phases[j]]
+                        cumulative_costs += inputs.costs[phases[j]]
                     st.write(f"Costs: ${cumulative_costs:.1f}M")
 
 
@@ -148,15 +148,15 @@ def create_pie_chart(data):
     return fig
 
 
-def create_comparison_bar_chart(data):
+def create_comparison_bar_chart(labels, values):
     """Create a comparison bar chart for decision options."""
     fig = go.Figure(
         data=[
             go.Bar(
-                x=data["Option"],
-                y=data["Expected Value ($M)"],
+                x=labels,
+                y=values,
                 marker_color=["#17a2b8", "#28a745"],
-                text=[f"${v:.1f}M" for v in data["Expected Value ($M)"]],
+                text=[f"${v:.1f}M" for v in values],
                 textposition="auto",
             )
         ]
@@ -172,6 +172,22 @@ def create_comparison_bar_chart(data):
     return fig
 
 
+@st.cache_data(max_entries=32)
+def _cached_comparison_chart(deal_now, continue_dev):
+    return create_comparison_bar_chart(
+        ["Out-License Now", "Continue Development"], [deal_now, continue_dev]
+    )
+
+
+def get_comparison_chart(deal_now, continue_dev):
+    """Return the decision comparison chart, cached on the two values.
+
+    The values are rounded to display precision so float noise from
+    upstream recalculations does not defeat the cache.
+    """
+    return _cached_comparison_chart(round(deal_now, 2), round(continue_dev, 2))
+
+
 def display_recommendation(recommendation, value_diff):
     """Display recommendation with native Streamlit components."""
     if recommendation == "Continue Development":
@@ -185,7 +201,13 @@ def display_recommendation(recommendation, value_diff):
 
 
 def display_formula_expander(title, formula, explanation):
-    """Display a formula with explanation in an expander."""
+    """Display a formula with explanation in an expander.
+
+    `formula` and `explanation` may be zero-argument callables, in which
+    case the strings are only built when the expander is rendered — use
+    this for interpolated content so the f-string work is skipped when
+    the caller decides not to render the section.
+    """
     with st.expander(title, expanded=False):
-        st.code(formula)
-        st.write(explanation)
+        st.code(formula() if callable(formula) else formula)
+        st.write(explanation() if callable(explanation) else explanation)
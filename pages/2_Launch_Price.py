@@ -3,15 +3,27 @@ import pandas as pd
 import plotly.express as px
 
 
+# Order of entry lookups, built once at import instead of per rerun
+_ORDER_MULTIPLIERS = {
+    "first": 1.0,  # 100% for first-in-class
+    "second": 0.67,  # 67% for second-in-class
+    "third": 0.5,  # 50% for third-in-class
+    "later": 0.3,  # 30% for later entrants
+}
+
+_ORDER_LABELS = {
+    "first": "1st (100%)",
+    "second": "2nd (67%)",
+    "third": "3rd (50%)",
+    "later": "Later (30%)",
+}
+
+_ORDER_OPTIONS = tuple(_ORDER_MULTIPLIERS)
+
+
 def get_order_multiplier(order_of_entry):
     """Calculate the order of entry multiplier."""
-    multipliers = {
-        "first": 1.0,  # 100% for first-in-class
-        "second": 0.67,  # 67% for second-in-class
-        "third": 0.5,  # 50% for third-in-class
-        "later": 0.3,  # 30% for later entrants
-    }
-    return multipliers.get(order_of_entry, 1.0)
+    return _ORDER_MULTIPLIERS.get(order_of_entry, 1.0)
 
 
 def calculate_market_penetration(treated_patients, diagnosed_patients, adoption_rate):
@@ -170,13 +182,8 @@ def launch_price_calculator_page():
         )
         order_of_entry = st.selectbox(
             "Order of Entry",
-            options=["first", "second", "third", "later"],
-            format_func=lambda x: {
-                "first": "1st (100%)",
-                "second": "2nd (67%)",
-                "third": "3rd (50%)",
-                "later": "Later (30%)",
-            }[x],
+            options=_ORDER_OPTIONS,
+            format_func=lambda x: _ORDER_LABELS[x],
         )
         estimated_patients = st.number_input(
             "Estimated Patients", min_value=0, value=100000, step=1000
@@ -5,10 +5,15 @@ from utils.calculations import (
     calculate_deal_percentages,
     calculate_required_deal_value,
 )
-from utils.state import get_stage_options
+from utils.state import get_stage_options, get_stage_keys, get_stage_index
 from components.ui_components import create_pie_chart
 
 
+def _changed(a: float, b: float, eps: float = 1e-4) -> bool:
+    """Whether two values differ beyond display precision (round to 1 decimal)."""
+    return abs(a - b) > eps
+
+
 def deal_analysis_page():
     """Display the deal analysis page."""
     st.header("Deal Analysis")
@@ -21,17 +26,15 @@ def deal_analysis_page():
         stage_options = get_stage_options()
         selected_stage = st.selectbox(
             "Deal Stage",
-            options=list(stage_options.keys()),
+            options=get_stage_keys(),
             format_func=lambda x: stage_options[x],
-            index=list(stage_options.keys()).index(
-                st.session_state.inputs["dealStage"]
-            ),
+            index=get_stage_index(st.session_state.inputs.dealStage),
         )
         # Update the deal stage and recalculate percentages if needed
-        if selected_stage != st.session_state.inputs["dealStage"]:
-            st.session_state.inputs["dealStage"] = selected_stage
+        if selected_stage != st.session_state.inputs.dealStage:
+            st.session_state.inputs.dealStage = selected_stage
             percentages = calculate_deal_percentages(st.session_state.inputs)
-            st.session_state.inputs["desiredShare"] = round(
+            st.session_state.inputs.desiredShare = round(
                 percentages["partnerShare"], 1
             )
 
@@ -39,14 +42,14 @@ def deal_analysis_page():
         new_deal_value = st.number_input(
             "Deal Value ($M)",
             min_value=0.0,
-            value=float(st.session_state.inputs["dealValue"]),
+            value=st.session_state.inputs.dealValue,
             step=0.1,
         )
         # Update deal value and recalculate percentages if needed
-        if new_deal_value != st.session_state.inputs["dealValue"]:
-            st.session_state.inputs["dealValue"] = new_deal_value
+        if _changed(new_deal_value, st.session_state.inputs.dealValue):
+            st.session_state.inputs.dealValue = new_deal_value
             percentages = calculate_deal_percentages(st.session_state.inputs)
-            st.session_state.inputs["desiredShare"] = round(
+            st.session_state.inputs.desiredShare = round(
                 percentages["partnerShare"], 1
             )
 
@@ -55,23 +58,23 @@ def deal_analysis_page():
             "Partner's Share (%)",
             min_value=0.0,
             max_value=100.0,
-            value=float(st.session_state.inputs["desiredShare"]),
+            value=st.session_state.inputs.desiredShare,
             step=1.0,
         )
         # Update share percentage and recalculate deal value if needed
-        if new_share != st.session_state.inputs["desiredShare"]:
-            st.session_state.inputs["desiredShare"] = new_share
+        if _changed(new_share, st.session_state.inputs.desiredShare):
+            st.session_state.inputs.desiredShare = new_share
             required_deal_value = calculate_required_deal_value(
                 st.session_state.inputs, new_share
             )
-            st.session_state.inputs["dealValue"] = round(required_deal_value, 1)
+            st.session_state.inputs.dealValue = round(required_deal_value, 1)
 
     # Deal Value Analysis
     st.subheader("Deal Value Analysis")
 
     percentages = calculate_deal_percentages(st.session_state.inputs)
     phase_value = calculate_phase_value(
-        st.session_state.inputs, st.session_state.inputs["dealStage"]
+        st.session_state.inputs, st.session_state.inputs.dealStage
     )
 
     # Display information in a structured way with cards
@@ -95,7 +98,7 @@ def deal_analysis_page():
             with metrics_col2:
                 st.metric(
                     label="Current Deal Value",
-                    value=f"${st.session_state.inputs['dealValue']}M",
+                    value=f"${st.session_state.inputs.dealValue}M",
                 )
                 st.metric(
                     label="Resulting Ownership Percentage",
@@ -106,7 +109,7 @@ def deal_analysis_page():
                 st.markdown("---")
                 st.markdown("**Ownership Calculation:**")
                 st.code(
-                    f"Ownership % = Deal Value ÷ Asset Value = ${st.session_state.inputs['dealValue']}M ÷ ${phase_value:.1f}M = {percentages['partnerShare']:.1f}%"
+                    f"Ownership % = Deal Value ÷ Asset Value = ${st.session_state.inputs.dealValue}M ÷ ${phase_value:.1f}M = {percentages['partnerShare']:.1f}%"
                 )
 
     with col2:
@@ -136,10 +139,10 @@ def deal_analysis_page():
             # Deal assessment
             deal_assessment = (
                 "⚠️ Undervalued"
-                if st.session_state.inputs["dealValue"] < phase_value * 0.1
+                if st.session_state.inputs.dealValue < phase_value * 0.1
                 else (
                     "⚠️ Overvalued"
-                    if st.session_state.inputs["dealValue"] > phase_value * 0.9
+                    if st.session_state.inputs.dealValue > phase_value * 0.9
                     else "✓ Fair value"
                 )
             )
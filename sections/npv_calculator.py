@@ -1,10 +1,98 @@
 import streamlit as st
 import pandas as pd
 from utils.calculations import calculate_phase_value
-from utils.state import get_phase_display_name, get_order_options, get_phases_list
+from utils.state import (
+    get_phase_display_name,
+    get_order_options,
+    get_order_keys,
+    get_phases_list,
+)
 from components.ui_components import display_npv_results
 
 
+# Static assumption text, allocated once at import instead of per rerun;
+# both sections live in one string so the expander issues a single
+# st.markdown call (one frontend delta message) instead of four
+_MODEL_ASSUMPTIONS_MD = """
+### Financial Assumptions
+
+- R&D costs subtracted from NPV when enabled
+- Only costs incurred up to current phase are subtracted
+- Deal value determines ownership percentage
+- No revenue milestone payments modeled
+
+### Valuation Assumptions
+
+- Risk-adjusted using cumulative probability
+- Time value adjustment using discount rate
+- Time Factor = 1 / (1 + Discount Rate)^Years to Market
+- Final NPV includes both risk adjustment and time value
+- Costs to date are subtracted from risk-adjusted, time-adjusted value
+- No terminal value included
+- No tax implications modeled
+"""
+
+# Widget configuration per phase-keyed input type: session-state key prefix,
+# widget label and the st.number_input kwargs shared by all five phase widgets
+_PHASE_WIDGETS = {
+    "timeToMarket": (
+        "time",
+        "Years to Market",
+        {"min_value": 0.0, "max_value": 20.0, "step": 0.5},
+    ),
+    "probabilities": (
+        "prob",
+        "Success Probability (%)",
+        {"min_value": 0, "max_value": 100},
+    ),
+    "costs": (
+        "cost",
+        "R&D and Clinical Costs ($M)",
+        {"min_value": 0.0, "step": 0.1},
+    ),
+}
+
+
+def _sync_phase_input(input_type, phase, key):
+    """Write a phase widget value back into the inputs dict when it changed."""
+    value = st.session_state[key]
+    phase_values = getattr(st.session_state.inputs, input_type)
+    if phase_values[phase] != value:
+        phase_values[phase] = value
+
+
+def _render_phase_input(input_type, phase):
+    """Render one number input bound directly to its widget key."""
+    prefix, label, widget_kwargs = _PHASE_WIDGETS[input_type]
+    cast = int if input_type == "probabilities" else float
+
+    key = f"{prefix}_{phase}"
+    if key not in st.session_state:
+        st.session_state[key] = cast(getattr(st.session_state.inputs, input_type)[phase])
+
+    st.number_input(
+        label,
+        key=key,
+        on_change=_sync_phase_input,
+        args=(input_type, phase, key),
+        **widget_kwargs,
+    )
+
+
+def _display_all_phase_inputs():
+    """Render timing, probability and cost inputs in a single column pass."""
+    st.subheader("Phase Inputs")
+    phases = get_phases_list()
+
+    cols = st.columns(len(phases))
+    for col, phase in zip(cols, phases):
+        with col:
+            st.markdown(f"**{get_phase_display_name(phase)}**")
+            _render_phase_input("timeToMarket", phase)
+            _render_phase_input("probabilities", phase)
+            _render_phase_input("costs", phase)
+
+
 def display_assumptions():
     """Display model assumptions section."""
     if st.session_state.show_assumptions:
@@ -12,26 +100,6 @@ def display_assumptions():
             col1, col2 = st.columns(2)
 
             with col1:
-                st.markdown("### Timing Assumptions (Years to Market)")
-                timing_cols = st.columns(5)
-                phases = get_phases_list()
-
-                for i, phase in enumerate(phases):
-                    with timing_cols[i]:
-                        display_name = get_phase_display_name(phase)
-                        st.session_state.inputs["timeToMarket"][phase] = (
-                            st.number_input(
-                                f"{display_name}",
-                                min_value=0.0,
-                                max_value=20.0,
-                                value=float(
-                                    st.session_state.inputs["timeToMarket"][phase]
-                                ),
-                                step=0.5,
-                                key=f"time_{phase}",
-                            )
-                        )
-
                 st.markdown("### Market Entry Multipliers")
                 entry_cols = st.columns(4)
 
@@ -43,43 +111,22 @@ def display_assumptions():
                 }
 
                 for i, (order, value) in enumerate(
-                    st.session_state.inputs["orderMultipliers"].items()
+                    st.session_state.inputs.orderMultipliers.items()
                 ):
                     with entry_cols[i]:
-                        st.session_state.inputs["orderMultipliers"][order] = (
+                        st.session_state.inputs.orderMultipliers[order] = (
                             st.number_input(
                                 f"{labels[order]}",
                                 min_value=0.0,
                                 max_value=1.0,
-                                value=float(value),
+                                value=value,
                                 step=0.01,
                                 key=f"multiplier_{order}",
                             )
                         )
 
             with col2:
-                st.markdown("### Financial Assumptions")
-                st.markdown(
-                    """
-                - R&D costs subtracted from NPV when enabled
-                - Only costs incurred up to current phase are subtracted
-                - Deal value determines ownership percentage
-                - No revenue milestone payments modeled
-                """
-                )
-
-                st.markdown("### Valuation Assumptions")
-                st.markdown(
-                    """
-                - Risk-adjusted using cumulative probability
-                - Time value adjustment using discount rate
-                - Time Factor = 1 / (1 + Discount Rate)^Years to Market
-                - Final NPV includes both risk adjustment and time value
-                - Costs to date are subtracted from risk-adjusted, time-adjusted value
-                - No terminal value included
-                - No tax implications modeled
-                """
-                )
+                st.markdown(_MODEL_ASSUMPTIONS_MD)
 
 
 def display_formulas():
@@ -126,78 +173,38 @@ def display_basic_inputs():
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.session_state.inputs["launchValue"] = st.number_input(
+        st.session_state.inputs.launchValue = st.number_input(
             "Launch Value ($M)",
             min_value=0,
-            value=st.session_state.inputs["launchValue"],
+            value=st.session_state.inputs.launchValue,
             step=50,
         )
 
     with col2:
         order_options = get_order_options()
-        st.session_state.inputs["orderOfEntry"] = st.selectbox(
+        st.session_state.inputs.orderOfEntry = st.selectbox(
             "Order of Entry",
-            options=list(order_options.keys()),
+            options=get_order_keys(),
             format_func=lambda x: order_options[x],
-            index=st.session_state.inputs["orderOfEntry"] - 1,
+            index=st.session_state.inputs.orderOfEntry - 1,
         )
 
     with col3:
-        st.session_state.inputs["discountRate"] = st.number_input(
+        st.session_state.inputs.discountRate = st.number_input(
             "Discount Rate (%)",
             min_value=0.0,
             max_value=30.0,
-            value=float(st.session_state.inputs["discountRate"]),
+            value=st.session_state.inputs.discountRate,
             step=0.5,
         )
 
     # R&D Costs Toggle
-    st.session_state.inputs["includeRDCosts"] = st.checkbox(
+    st.session_state.inputs.includeRDCosts = st.checkbox(
         "Include R&D and Clinical Costs in NPV Calculation",
-        value=st.session_state.inputs["includeRDCosts"],
+        value=st.session_state.inputs.includeRDCosts,
     )
 
 
-def display_probabilities():
-    """Display success probabilities section."""
-    st.subheader("Success Probabilities (%)")
-    phases = get_phases_list()
-
-    # Use columns for layout
-    prob_cols = st.columns(len(phases))
-
-    for i, phase in enumerate(phases):
-        with prob_cols[i]:
-            display_name = get_phase_display_name(phase)
-            st.session_state.inputs["probabilities"][phase] = st.number_input(
-                f"{display_name}",
-                min_value=0,
-                max_value=100,
-                value=int(st.session_state.inputs["probabilities"][phase]),
-                key=f"prob_{phase}",
-            )
-
-
-def display_costs():
-    """Display R&D and clinical costs section."""
-    st.subheader("R&D and Clinical Costs ($M)")
-    phases = get_phases_list()
-
-    # Use columns for layout
-    cost_cols = st.columns(len(phases))
-
-    for i, phase in enumerate(phases):
-        with cost_cols[i]:
-            display_name = get_phase_display_name(phase)
-            st.session_state.inputs["costs"][phase] = st.number_input(
-                f"{display_name}",
-                min_value=0.0,
-                value=float(st.session_state.inputs["costs"][phase]),
-                step=0.1,
-                key=f"cost_{phase}",
-            )
-
-
 def npv_calculator_page():
     """Display the NPV calculator page."""
     # Display assumptions and formulas
@@ -206,8 +213,7 @@ def npv_calculator_page():
 
     # Display inputs
     display_basic_inputs()
-    display_probabilities()
-    display_costs()
+    _display_all_phase_inputs()
 
     # Display results
     display_npv_results(st.session_state.inputs)
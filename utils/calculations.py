@@ -0,0 +1,444 @@
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Dict, Final, List, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+# Interned so phase keys hash and compare by pointer in the dict lookups
+# below; session-state dicts built from these names share the same objects
+_PHASES: Final = tuple(
+    sys.intern(p)
+    for p in ("preclinical", "phase1", "phase2", "phase3", "registration")
+)
+_PHASE_INDEX: Final = {p: i for i, p in enumerate(_PHASES)}
+
+__all__ = [
+    "PhaseInputs",
+    "PhaseArrays",
+    "StrategicDecisionResult",
+    "validate_inputs",
+    "to_phase_arrays",
+    "get_phases_up_to",
+    "get_order_multiplier",
+    "get_cumulative_probability",
+    "get_cumulative_costs",
+    "calculate_phase_value",
+    "calculate_all_phase_values",
+    "calculate_deal_percentages",
+    "calculate_required_deal_value",
+    "calculate_strategic_decision",
+    "calculate_all_strategic_decisions",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseInputs:
+    """Validated inputs for the NPV calculations."""
+
+    launchValue: float
+    orderOfEntry: int
+    discountRate: float
+    includeRDCosts: bool
+    dealStage: str
+    dealValue: float
+    desiredShare: float
+    probabilities: Dict[str, float]
+    costs: Dict[str, float]
+    timeToMarket: Dict[str, float]
+    orderMultipliers: Dict[int, float]
+
+
+# The field order of PhaseInputs; the getters fetch all fields from a
+# dict or an attribute-style inputs object in one C-level call
+_INPUT_FIELDS: Final = (
+    "launchValue",
+    "orderOfEntry",
+    "discountRate",
+    "includeRDCosts",
+    "dealStage",
+    "dealValue",
+    "desiredShare",
+    "probabilities",
+    "costs",
+    "timeToMarket",
+    "orderMultipliers",
+)
+_INPUT_GETTER: Final = itemgetter(*_INPUT_FIELDS)
+_INPUT_ATTR_GETTER: Final = attrgetter(*_INPUT_FIELDS)
+
+
+def validate_inputs(inputs) -> PhaseInputs:
+    """Normalize raw session-state inputs into a PhaseInputs instance."""
+    # Fast path first: already-validated inputs pass through untouched
+    if isinstance(inputs, PhaseInputs):
+        return inputs
+    if isinstance(inputs, dict):
+        try:
+            return PhaseInputs(*_INPUT_GETTER(inputs))
+        except KeyError as exc:
+            raise ValueError(f"Missing required input: {exc}") from exc
+    # Attribute-style inputs, e.g. the InputParameters instance held in
+    # session state
+    try:
+        return PhaseInputs(*_INPUT_ATTR_GETTER(inputs))
+    except AttributeError as exc:
+        raise TypeError(f"Unsupported inputs type: {type(inputs)!r}") from exc
+
+
+@dataclass(frozen=True, slots=True)
+class StrategicDecisionResult:
+    """Outcome of comparing out-licensing now against continuing development."""
+
+    current_phase_value: float
+    next_phase: Optional[str]
+    probability_next_phase: float
+    out_license_percentage: float
+    deal_now_value: float
+    continue_develop_value: float
+    value_difference: float
+    recommendation: str
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseArrays:
+    """Structure-of-arrays view of the per-phase inputs, aligned to _PHASES."""
+
+    probs: np.ndarray
+    costs: np.ndarray
+    times: np.ndarray
+
+
+@lru_cache(maxsize=256)
+def _phase_arrays_cached(
+    probs: Tuple[float, ...], costs: Tuple[float, ...], times: Tuple[float, ...]
+) -> PhaseArrays:
+    """Build the array view once per distinct set of per-phase values.
+
+    The arrays are marked read-only because cache hits hand the same
+    instance to every caller.
+    """
+    arrays = PhaseArrays(
+        probs=np.array(probs, dtype=float),
+        costs=np.array(costs, dtype=float),
+        times=np.array(times, dtype=float),
+    )
+    arrays.probs.setflags(write=False)
+    arrays.costs.setflags(write=False)
+    arrays.times.setflags(write=False)
+    return arrays
+
+
+def to_phase_arrays(inputs) -> PhaseArrays:
+    """Convert the per-phase input dicts into contiguous arrays."""
+    phase_inputs = validate_inputs(inputs)
+    return _phase_arrays_cached(
+        tuple(phase_inputs.probabilities[p] for p in _PHASES),
+        tuple(phase_inputs.costs[p] for p in _PHASES),
+        tuple(phase_inputs.timeToMarket[p] for p in _PHASES),
+    )
+
+
+def _freeze_inputs(inputs) -> Tuple:
+    """Flatten the inputs into a hashable tuple usable as a cache key."""
+    phase_inputs = validate_inputs(inputs)
+    return (
+        phase_inputs.launchValue,
+        phase_inputs.orderOfEntry,
+        phase_inputs.discountRate,
+        phase_inputs.includeRDCosts,
+        phase_inputs.dealStage,
+        phase_inputs.dealValue,
+        phase_inputs.desiredShare,
+        tuple(sorted(phase_inputs.probabilities.items())),
+        tuple(sorted(phase_inputs.costs.items())),
+        tuple(sorted(phase_inputs.timeToMarket.items())),
+        tuple(sorted(phase_inputs.orderMultipliers.items())),
+    )
+
+
+def _unfreeze_inputs(frozen: Tuple) -> dict:
+    """Rebuild an inputs dict from a tuple produced by _freeze_inputs."""
+    (launch, order, rate, include_rd, deal_stage, deal_value, desired_share,
+     probs, costs, times, mults) = frozen
+    return {
+        "launchValue": launch,
+        "orderOfEntry": order,
+        "discountRate": rate,
+        "includeRDCosts": include_rd,
+        "dealStage": deal_stage,
+        "dealValue": deal_value,
+        "desiredShare": desired_share,
+        "probabilities": dict(probs),
+        "costs": dict(costs),
+        "timeToMarket": dict(times),
+        "orderMultipliers": dict(mults),
+    }
+
+
+@lru_cache(maxsize=256)
+def _cumulative_probability_table(probs_tuple: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Suffix products of the phase probabilities as 0-1 fractions.
+
+    Entry i is the probability of reaching market from phase i, so a
+    lookup replaces the per-call multiplication chain.
+    """
+    table = [1.0] * len(probs_tuple)
+    running = 1.0
+    for i in range(len(probs_tuple) - 1, -1, -1):
+        running *= probs_tuple[i] / 100.0
+        table[i] = running
+    return tuple(table)
+
+
+@lru_cache(maxsize=256)
+def _cumulative_costs_table(costs_tuple: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Prefix sums of the per-phase costs.
+
+    Entry i is the total cost incurred up to and including phase i.
+    """
+    table = []
+    total = 0.0
+    for cost in costs_tuple:
+        total += cost
+        table.append(total)
+    return tuple(table)
+
+
+@lru_cache(maxsize=256)
+def _cumulative_probability_array(probs_tuple: Tuple[float, ...]) -> np.ndarray:
+    """Array view of the 0-1 suffix-product table, for the vectorized path."""
+    array = np.array(_cumulative_probability_table(probs_tuple), dtype=float)
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=256)
+def _cumulative_costs_array(costs_tuple: Tuple[float, ...]) -> np.ndarray:
+    """Array view of the prefix-sum cost table, for the vectorized path."""
+    array = np.array(_cumulative_costs_table(costs_tuple), dtype=float)
+    array.setflags(write=False)
+    return array
+
+
+_PHASES_UP_TO: Final = tuple(_PHASES[: i + 1] for i in range(len(_PHASES)))
+
+
+def get_phases_up_to(phase: str) -> Tuple[str, ...]:
+    """Return all phases up to and including the given phase."""
+    return _PHASES_UP_TO[_PHASE_INDEX[phase]]
+
+
+@lru_cache(maxsize=256)
+def _discount_factor(rate: float, time: float) -> float:
+    """Discount factor (1 + rate/100) ** time, cached per (rate, time).
+
+    The pair is stable across a session unless the user moves a widget,
+    so repeated phase evaluations reuse one pow result.
+    """
+    return (1.0 + rate / 100.0) ** time
+
+
+def get_order_multiplier(inputs, order: int) -> float:
+    """Return the market entry multiplier for an order of entry."""
+    phase_inputs = validate_inputs(inputs)
+    return phase_inputs.orderMultipliers.get(order, 1.0)
+
+
+def get_cumulative_probability(inputs, phase: str) -> float:
+    """Probability (0-1) of reaching market from the given phase."""
+    phase_inputs = validate_inputs(inputs)
+    probs_tuple = tuple(phase_inputs.probabilities[p] for p in _PHASES)
+    return _cumulative_probability_table(probs_tuple)[_PHASE_INDEX[phase]]
+
+
+def get_cumulative_costs(inputs, phase: str) -> float:
+    """Total R&D and clinical costs incurred up to the given phase."""
+    phase_inputs = validate_inputs(inputs)
+    costs_tuple = tuple(phase_inputs.costs[p] for p in _PHASES)
+    return _cumulative_costs_table(costs_tuple)[_PHASE_INDEX[phase]]
+
+
+def calculate_phase_value(inputs, phase: str) -> float:
+    """Calculate the risk- and time-adjusted NPV of the asset at a phase.
+
+    Memoized on the frozen inputs signature, so the repeated calls the
+    deal and strategic flows make with unchanged inputs are O(1).
+    """
+    return _phase_value_cached(_freeze_inputs(inputs), phase)
+
+
+@lru_cache(maxsize=2048)
+def _phase_value_cached(frozen: Tuple, phase: str) -> float:
+    # Composes the shared cumulative tables; this is the single source of
+    # the NPV arithmetic, so the scalar and vectorized paths cannot drift
+    phase_inputs = validate_inputs(_unfreeze_inputs(frozen))
+    phase_idx = _PHASE_INDEX[phase]
+
+    probs_tuple = tuple(phase_inputs.probabilities[p] for p in _PHASES)
+    probability = _cumulative_probability_table(probs_tuple)[phase_idx]
+    discount = _discount_factor(
+        phase_inputs.discountRate, phase_inputs.timeToMarket[phase]
+    )
+
+    # Inlined get_order_multiplier: skips a redundant validate_inputs call
+    base_value = phase_inputs.launchValue * phase_inputs.orderMultipliers.get(
+        phase_inputs.orderOfEntry, 1.0
+    )
+    value = base_value * probability / discount
+
+    if phase_inputs.includeRDCosts:
+        costs_tuple = tuple(phase_inputs.costs[p] for p in _PHASES)
+        value -= _cumulative_costs_table(costs_tuple)[phase_idx]
+
+    return value
+
+
+def calculate_all_phase_values(inputs) -> np.ndarray:
+    """Calculate the NPV at every phase in a single vectorized pass."""
+    phase_inputs = validate_inputs(inputs)
+    arrays = to_phase_arrays(phase_inputs)
+
+    # Both tables are already normalized to 0-1 fractions and cached, so
+    # this pass pays no per-call division or cumprod/cumsum
+    cum_prob = _cumulative_probability_array(tuple(arrays.probs))
+    time_factor = 1.0 / (1.0 + phase_inputs.discountRate / 100.0) ** arrays.times
+
+    base_value = phase_inputs.launchValue * phase_inputs.orderMultipliers.get(
+        phase_inputs.orderOfEntry, 1.0
+    )
+    values = base_value * cum_prob * time_factor
+
+    if phase_inputs.includeRDCosts:
+        values = values - _cumulative_costs_array(tuple(arrays.costs))
+
+    return values
+
+
+def calculate_deal_percentages(inputs) -> Dict[str, float]:
+    """Calculate partner/company ownership split implied by the deal value.
+
+    Memoized on the frozen inputs; a shallow copy is returned so cache
+    hits cannot leak a shared mutable dict to callers.
+    """
+    return dict(_deal_percentages_cached(_freeze_inputs(inputs)))
+
+
+@lru_cache(maxsize=256)
+def _deal_percentages_cached(frozen: Tuple) -> Dict[str, float]:
+    phase_inputs = validate_inputs(_unfreeze_inputs(frozen))
+    phase_value = calculate_phase_value(phase_inputs, phase_inputs.dealStage)
+
+    if phase_value > 0:
+        partner_share = min(max(phase_inputs.dealValue / phase_value * 100, 0.0), 100.0)
+    else:
+        partner_share = 0.0
+
+    return {
+        "partnerShare": partner_share,
+        "companyShare": 100.0 - partner_share,
+        "valuePerShare": phase_value / 100 if phase_value > 0 else 0.0,
+    }
+
+
+def calculate_required_deal_value(inputs, desired_share: float) -> float:
+    """Calculate the deal value required for a desired ownership share."""
+    return _required_deal_value_cached(_freeze_inputs(inputs), desired_share)
+
+
+@lru_cache(maxsize=256)
+def _required_deal_value_cached(frozen: Tuple, desired_share: float) -> float:
+    phase_inputs = validate_inputs(_unfreeze_inputs(frozen))
+    phase_value = calculate_phase_value(phase_inputs, phase_inputs.dealStage)
+    return phase_value * desired_share / 100
+
+
+def calculate_all_strategic_decisions(
+    inputs, out_license_percentage: float
+) -> Tuple[StrategicDecisionResult, ...]:
+    """Evaluate the out-license/continue decision at every phase at once.
+
+    All five decisions are derived from a single vectorized phase-value
+    pass, so a "what if I decided at each stage" display costs one NumPy
+    evaluation instead of five separate calls.
+    """
+    return _all_strategic_decisions_cached(
+        _freeze_inputs(inputs), out_license_percentage
+    )
+
+
+@lru_cache(maxsize=64)
+def _all_strategic_decisions_cached(
+    frozen: Tuple, out_license_percentage: float
+) -> Tuple[StrategicDecisionResult, ...]:
+    inputs = _unfreeze_inputs(frozen)
+    return tuple(
+        _strategic_decision_impl(inputs, stage, out_license_percentage)
+        for stage in _PHASES
+    )
+
+
+def calculate_strategic_decision(
+    inputs, current_stage: str, out_license_percentage: float
+) -> StrategicDecisionResult:
+    """Compare out-licensing now against continuing development.
+
+    Cached on the model inputs, so reruns triggered by unrelated widgets
+    skip the recomputation entirely.
+    """
+    return _strategic_decision_cached(
+        _freeze_inputs(inputs), current_stage, out_license_percentage
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _strategic_decision_cached(
+    frozen: Tuple, current_stage: str, out_license_percentage: float
+) -> StrategicDecisionResult:
+    return _strategic_decision_impl(
+        _unfreeze_inputs(frozen), current_stage, out_license_percentage
+    )
+
+
+def _strategic_decision_impl(
+    inputs, current_stage: str, out_license_percentage: float
+) -> StrategicDecisionResult:
+    phase_inputs = validate_inputs(inputs)
+
+    current_index = _PHASE_INDEX[current_stage]
+    next_phase: Optional[str] = (
+        _PHASES[current_index + 1] if current_index < len(_PHASES) - 1 else None
+    )
+
+    # One vectorized pass covers both the current and the next phase
+    phase_values = calculate_all_phase_values(phase_inputs)
+    current_phase_value = float(phase_values[current_index])
+
+    # Out-licensing splits the current value but keeps its total
+    deal_now_value = current_phase_value
+
+    if next_phase:
+        probability_next_phase = float(phase_inputs.probabilities[current_stage])
+        next_phase_value = float(phase_values[current_index + 1])
+        continue_develop_value = next_phase_value * probability_next_phase / 100
+    else:
+        probability_next_phase = 0.0
+        continue_develop_value = 0.0
+
+    if next_phase and continue_develop_value > deal_now_value:
+        recommendation = "Continue Development"
+    else:
+        recommendation = "Out-License Now"
+
+    return StrategicDecisionResult(
+        current_phase_value=current_phase_value,
+        next_phase=next_phase,
+        probability_next_phase=probability_next_phase,
+        out_license_percentage=out_license_percentage,
+        deal_now_value=deal_now_value,
+        continue_develop_value=continue_develop_value,
+        value_difference=abs(continue_develop_value - deal_now_value),
+        recommendation=recommendation,
+    )
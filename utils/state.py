@@ -0,0 +1,154 @@
+import streamlit as st
+from dataclasses import asdict, dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Tuple
+
+
+# Market entry multipliers by order of entry; built once at import and
+# copied per session so widget edits never touch the defaults
+_DEFAULT_ORDER_MULTIPLIERS = MappingProxyType(
+    {
+        1: 1.0,  # 100% for first-in-class
+        2: 0.67,  # 67% for second-in-class
+        3: 0.5,  # 50% for third-in-class
+        4: 0.3,  # 30% for later entrants
+    }
+)
+
+
+@dataclass(slots=True)
+class InputParameters:
+    """Default model inputs for the NPV calculator."""
+
+    launchValue: int = 1000
+    orderOfEntry: int = 1
+    discountRate: float = 10.0
+    includeRDCosts: bool = True
+    dealStage: str = "phase2"
+    dealValue: float = 50.0
+    desiredShare: float = 25.0
+    probabilities: Dict[str, int] = field(
+        default_factory=lambda: {
+            "preclinical": 40,
+            "phase1": 60,
+            "phase2": 35,
+            "phase3": 65,
+            "registration": 90,
+        }
+    )
+    costs: Dict[str, float] = field(
+        default_factory=lambda: {
+            "preclinical": 5.0,
+            "phase1": 10.0,
+            "phase2": 30.0,
+            "phase3": 80.0,
+            "registration": 5.0,
+        }
+    )
+    timeToMarket: Dict[str, float] = field(
+        default_factory=lambda: {
+            "preclinical": 10.0,
+            "phase1": 8.0,
+            "phase2": 6.0,
+            "phase3": 4.0,
+            "registration": 1.0,
+        }
+    )
+    orderMultipliers: Dict[int, float] = field(
+        default_factory=lambda: dict(_DEFAULT_ORDER_MULTIPLIERS)
+    )
+
+    def to_dict(self) -> dict:
+        # asdict copies the nested dicts too, so session state can mutate
+        # the result without touching the instance defaults
+        return asdict(self)
+
+
+# Scalar session defaults; the inputs dict is handled separately because
+# its defaults live on InputParameters and must be copied per session
+_DEFAULT_SESSION = {
+    "show_assumptions": False,
+    "show_formulas": False,
+}
+
+
+def initialize_session_state() -> None:
+    """Initialize session state variables if they don't exist."""
+    if "inputs" not in st.session_state:
+        # Stored as the instance itself: attribute access on the slotted
+        # dataclass beats string-keyed dict lookups on every rerun
+        st.session_state.inputs = InputParameters()
+
+    for key, value in _DEFAULT_SESSION.items():
+        st.session_state.setdefault(key, value)
+
+
+# Display names and selectbox options are static; build the lookups once
+# at import instead of as per-call dict literals. The phase display map
+# is read-only and doubles as the stage options table.
+_PHASE_DISPLAY = MappingProxyType(
+    {
+        "preclinical": "Preclinical",
+        "phase1": "Phase 1",
+        "phase2": "Phase 2",
+        "phase3": "Phase 3",
+        "registration": "Registration",
+    }
+)
+
+_ORDER_OPTIONS = {
+    1: "1st to market",
+    2: "2nd to market",
+    3: "3rd to market",
+    4: "4th+ to market",
+}
+
+
+_PHASES_LIST = ("preclinical", "phase1", "phase2", "phase3", "registration")
+
+
+def get_phases_list() -> Tuple[str, ...]:
+    """Return the development phases in order."""
+    # Immutable module constant; cheaper than a cached copy per call
+    return _PHASES_LIST
+
+
+def get_phase_display_name(phase: str) -> str:
+    """Return the display name for a phase key."""
+    return _PHASE_DISPLAY.get(phase, phase)
+
+
+@st.cache_data
+def get_stage_options() -> Dict[str, str]:
+    """Return the development stage options for selectboxes."""
+    # Materialized to a plain dict because st.cache_data pickles results
+    return dict(_PHASE_DISPLAY)
+
+
+@st.cache_data
+def _stage_index_map() -> Dict[str, int]:
+    """Map each stage key to its selectbox index, built once per session."""
+    return {stage: i for i, stage in enumerate(get_stage_options())}
+
+
+@st.cache_data
+def get_stage_keys() -> List[str]:
+    """Return the stage keys for use as selectbox options."""
+    return list(get_stage_options().keys())
+
+
+def get_stage_index(stage: str) -> int:
+    """Return the selectbox index of a stage in O(1)."""
+    return _stage_index_map()[stage]
+
+
+@st.cache_data
+def get_order_options() -> Dict[int, str]:
+    """Return the order of entry options for selectboxes."""
+    return _ORDER_OPTIONS
+
+
+@st.cache_data
+def get_order_keys() -> List[int]:
+    """Return the order of entry keys for use as selectbox options."""
+    return list(get_order_options().keys())
@@ -0,0 +1,122 @@
+"""Export the pharma asset valuation model to an Excel workbook.
+
+Standalone companion to the Streamlit app: writes the default model
+assumptions, the per-phase inputs and the risk-adjusted DCF valuation to
+Pharma_Valuation_Model.xlsx so the model can be reviewed and tweaked
+offline. Run with `python valuation_model.py`.
+"""
+
+from functools import lru_cache
+
+import xlsxwriter
+
+PHASES = ["Preclinical", "Phase 1", "Phase 2", "Phase 3", "Registration"]
+
+# Default model inputs; mirror InputParameters in utils/state.py
+LAUNCH_VALUE = 1000.0
+ORDER_MULTIPLIER = 1.0
+DISCOUNT_RATE = 10.0
+PROBABILITIES = [40.0, 60.0, 35.0, 65.0, 90.0]
+COSTS = [5.0, 10.0, 30.0, 80.0, 5.0]
+TIMES_TO_MARKET = [10.0, 8.0, 6.0, 4.0, 1.0]
+
+
+@lru_cache(maxsize=1)
+def build_workbook(path="Pharma_Valuation_Model.xlsx"):
+    """Build the valuation workbook at `path` and return the path.
+
+    Memoized so repeated calls in one process (e.g. Streamlit reruns)
+    write the file once.
+    """
+    # Probability of reaching market from each phase (suffix product, 0-1)
+    cumulative_probabilities = []
+    running = 1.0
+    for prob in reversed(PROBABILITIES):
+        running *= prob / 100.0
+        cumulative_probabilities.append(running)
+    cumulative_probabilities.reverse()
+
+    # The valuation is evaluated here rather than left as Excel formulas:
+    # plain numbers open instantly (no recalc pass), survive streaming
+    # writers that cannot track inter-cell dependencies, and stay readable
+    # without copying formulas down
+    cumulative_costs = []
+    total = 0.0
+    for cost in COSTS:
+        total += cost
+        cumulative_costs.append(total)
+
+    discount_factors = [
+        1.0 / (1.0 + DISCOUNT_RATE / 100.0) ** years for years in TIMES_TO_MARKET
+    ]
+
+    revenues = [
+        LAUNCH_VALUE * ORDER_MULTIPLIER * prob for prob in cumulative_probabilities
+    ]
+
+    npvs = [
+        revenue * factor - cum_cost
+        for revenue, factor, cum_cost in zip(revenues, discount_factors, cumulative_costs)
+    ]
+
+    # Sheet order is workbook tab order; each entry is (header, rows)
+    sheets = {
+        "Dashboard": (
+            ("Metric", "Value"),
+            [
+                ("NPV at Preclinical ($M)", npvs[0]),
+                ("NPV at Phase 2 ($M)", npvs[2]),
+                ("NPV at Registration ($M)", npvs[4]),
+                ("Probability of Reaching Market from Phase 2", cumulative_probabilities[2]),
+                ("Total R&D Cost ($M)", cumulative_costs[-1]),
+            ],
+        ),
+        "Assumptions": (
+            ("Parameter", "Value"),
+            [
+                ("Launch Value ($M)", LAUNCH_VALUE),
+                ("Order Entry Multiplier", ORDER_MULTIPLIER),
+                ("Discount Rate (%)", DISCOUNT_RATE),
+                ("Include R&D Costs", True),
+            ],
+        ),
+        "Phases": (
+            ("Phase", "Success Probability (%)", "Cost ($M)", "Years to Market"),
+            list(zip(PHASES, PROBABILITIES, COSTS, TIMES_TO_MARKET)),
+        ),
+        "Probabilities": (
+            ("Phase", "Cumulative Probability"),
+            list(zip(PHASES, cumulative_probabilities)),
+        ),
+        "Costs": (
+            ("Phase", "Phase Cost ($M)", "Cumulative Cost ($M)"),
+            list(zip(PHASES, COSTS, cumulative_costs)),
+        ),
+        "Revenue": (
+            ("Phase", "Risk-Adjusted Peak Revenue ($M)"),
+            list(zip(PHASES, revenues)),
+        ),
+        "DCF": (
+            ("Phase", "Discount Factor", "Cumulative Cost ($M)", "NPV ($M)"),
+            list(zip(PHASES, discount_factors, cumulative_costs, npvs)),
+        ),
+    }
+
+    # constant_memory streams each row to disk as it is written instead of
+    # buffering the whole workbook; fine here because every sheet is written
+    # top-to-bottom and nothing uses merged cells
+    with xlsxwriter.Workbook(path, {"constant_memory": True}) as workbook:
+        # One Format object shared by every header cell in the workbook
+        header_format = workbook.add_format({"bold": True, "bg_color": "#DCE6F1"})
+
+        for name, (header, rows) in sheets.items():
+            worksheet = workbook.add_worksheet(name)
+            worksheet.write_row(0, 0, header, header_format)
+            for row_index, row in enumerate(rows, start=1):
+                worksheet.write_row(row_index, 0, row)
+
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build_workbook()}")